@@ -1,190 +1,412 @@
 """
 PDF Generator for API Documentation
 Generates a professional PDF with all API endpoints, requirements, and examples
+
+Performance: the time goes into importing ReportLab and its Platypus layout, not into
+numeric Python - the only arithmetic is constant unit scaling. JIT compilers such as
+Numba don't apply here; cache the rendered output instead (see _CACHED_PDF_BYTES).
 """
 
-from reportlab.lib.pagesizes import letter, A4
+from reportlab import Version as _REPORTLAB_VERSION
+from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, PageTemplate, Frame
+from reportlab.lib.units import inch, mm
+from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, PageBreak, LongTable, TableStyle
 from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-from datetime import datetime
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from io import BytesIO
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
+import hashlib
+import logging
+import os
+import re
+import sys
+import threading
 
-def create_api_pdf():
-    """Generate API documentation PDF"""
-    
-    # Create PDF document
-    pdf_filename = "API_DOCUMENTATION.pdf"
-    mm = 0.0393701  # mm to inch conversion
-    doc = SimpleDocTemplate(
-        pdf_filename,
-        pagesize=A4,
-        rightMargin=15*mm,
-        leftMargin=15*mm,
-        topMargin=20*mm,
-        bottomMargin=20*mm,
-        title="PHRMA API Documentation"
-    )
-    
-    # Container for the 'Flowable' objects
-    elements = []
-    
-    # Define styles
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=28,
-        textColor=colors.HexColor('#FFFFFF'),
-        spaceAfter=6,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor('#FFFFFF'),
-        spaceAfter=12,
-        spaceBefore=12,
-        fontName='Helvetica-Bold',
-        backColor=colors.HexColor('#667eea')
-    )
-    
-    subheading_style = ParagraphStyle(
-        'CustomSubHeading',
-        parent=styles['Heading3'],
-        fontSize=13,
-        textColor=colors.HexColor('#333333'),
-        spaceAfter=10,
-        spaceBefore=10,
-        fontName='Helvetica-Bold'
-    )
-    
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['BodyText'],
-        fontSize=10,
-        textColor=colors.HexColor('#333333'),
-        spaceAfter=8,
-        alignment=TA_JUSTIFY
-    )
-    
-    code_style = ParagraphStyle(
-        'CodeStyle',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.HexColor('#d4d4d4'),
-        backColor=colors.HexColor('#1e1e1e'),
-        spaceAfter=6,
-        fontName='Courier'
-    )
-    
-    # ============ TITLE PAGE ============
-    elements.append(Spacer(1, 1.5*inch))
-    
-    # Background colored box for title
+# The document content is static, so the rendered bytes are reused after the first build
+_CACHED_PDF_BYTES = None
+# Rendered PDFs keyed by a hash of their inputs, so later runs can skip ReportLab layout entirely
+_CACHE_DIRNAME = 'phrma'
+# Serialises the first render so concurrent callers don't all lay out the document
+_RENDER_LOCK = threading.Lock()
+
+# Status messages; silent unless the caller (or __main__) configures logging at INFO
+logger = logging.getLogger(__name__)
+
+# ============ COLORS ============
+# Parsed once at import instead of on every style definition
+_WHITE = colors.HexColor('#FFFFFF')
+_PURPLE = colors.HexColor('#667eea')
+_TEXT = colors.HexColor('#333333')
+# HexColor doesn't expand CSS shorthand: '#333' is 0x000333, not #333333 (like '#666' and '#ddd' below)
+_REQ_BOX_TEXT = colors.HexColor('#333')
+_MUTED_TEXT = colors.HexColor('#666')
+_CODE_TEXT = colors.HexColor('#d4d4d4')
+_CODE_BG = colors.HexColor('#1e1e1e')
+_WARN_BG = colors.HexColor('#fff3cd')
+_ERROR_TEXT = colors.HexColor('#721c24')
+_ERROR_BG = colors.HexColor('#f8d7da')
+_INFO_TEXT = colors.HexColor('#0066cc')
+_INFO_BG = colors.HexColor('#e7f3ff')
+_METADATA_BG = colors.HexColor('#f0f4ff')
+_GRID = colors.HexColor('#ddd')
+_ZEBRA = colors.HexColor('#f9f9f9')
+
+# ============ STYLES ============
+# Built once at import; every render shares the same style objects
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=28,
+    textColor=_WHITE,
+    spaceAfter=6,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold'
+)
+
+_SUBTITLE_STYLE = ParagraphStyle(
+    'Subtitle',
+    parent=_STYLES['Normal'],
+    fontSize=16,
+    textColor=_WHITE,
+    alignment=TA_CENTER
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=16,
+    textColor=_WHITE,
+    spaceAfter=12,
+    spaceBefore=12,
+    fontName='Helvetica-Bold',
+    backColor=_PURPLE
+)
+
+_SUBHEADING_STYLE = ParagraphStyle(
+    'CustomSubHeading',
+    parent=_STYLES['Heading3'],
+    fontSize=13,
+    textColor=_TEXT,
+    spaceAfter=10,
+    spaceBefore=10,
+    fontName='Helvetica-Bold'
+)
+
+_BODY_STYLE = ParagraphStyle(
+    'CustomBody',
+    parent=_STYLES['BodyText'],
+    fontSize=10,
+    textColor=_TEXT,
+    spaceAfter=8,
+    alignment=TA_JUSTIFY
+)
+
+_CODE_STYLE = ParagraphStyle(
+    'CodeStyle',
+    parent=_STYLES['Normal'],
+    fontSize=8,
+    textColor=_CODE_TEXT,
+    backColor=_CODE_BG,
+    spaceAfter=6,
+    fontName='Courier'
+)
+
+# Yellow "Requirements" call-out box
+_REQ_BOX_STYLE = ParagraphStyle(
+    'ReqBox',
+    parent=_STYLES['Normal'],
+    fontSize=9,
+    textColor=_REQ_BOX_TEXT,
+    backColor=_WARN_BG,
+    leftIndent=10,
+    spaceAfter=10
+)
+
+# The login requirements box is padded out beyond its text
+_LOGIN_REQ_BOX_STYLE = ParagraphStyle(
+    'ReqBox',
+    parent=_REQ_BOX_STYLE,
+    borderPadding=10
+)
+
+# Red "Authentication Required" call-out box
+_AUTH_STYLE = ParagraphStyle(
+    'Auth',
+    parent=_STYLES['Normal'],
+    fontSize=9,
+    textColor=_ERROR_TEXT,
+    backColor=_ERROR_BG,
+    leftIndent=10,
+    spaceAfter=10
+)
+
+# Blue informational note
+_NOTE_STYLE = ParagraphStyle(
+    'Note',
+    parent=_STYLES['Normal'],
+    fontSize=9,
+    textColor=_INFO_TEXT,
+    backColor=_INFO_BG,
+    leftIndent=10,
+    spaceAfter=10
+)
+
+_FOOTER_STYLE = ParagraphStyle(
+    'Footer',
+    parent=_STYLES['Normal'],
+    fontSize=9,
+    textColor=_MUTED_TEXT,
+    spaceAfter=10,
+    alignment=TA_CENTER
+)
+
+_TITLE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), _PURPLE),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 20),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 20),
+    ('TOPPADDING', (0, 0), (-1, -1), 20),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
+])
+
+_METADATA_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), _METADATA_BG),
+    ('TEXTCOLOR', (0, 0), (-1, -1), _TEXT),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ('TOPPADDING', (0, 0), (-1, -1), 12),
+    ('GRID', (0, 0), (-1, -1), 1, _GRID)
+])
+
+# Purple header row + zebra body rows shared by all data tables
+_HEADER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _PURPLE),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('TOPPADDING', (0, 0), (-1, 0), 8),
+    ('GRID', (0, 0), (-1, -1), 1, _GRID),
+])
+
+# Per-table variants; TOPPADDING 3 restores ReportLab's default cell padding
+_AUTH_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('TOPPADDING', (0, 0), (-1, 0), 10),
+], parent=_HEADER_TABLE_STYLE)
+
+_HEADERS_TABLE_STYLE = TableStyle([
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('TOPPADDING', (0, 0), (-1, 0), 3),
+], parent=_HEADER_TABLE_STYLE)
+
+_ROLES_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('TOPPADDING', (0, 0), (-1, 0), 3),
+], parent=_HEADER_TABLE_STYLE)
+
+# Smaller fonts for wide tables with many columns
+_COMPACT_HEADER_TABLE_STYLE = TableStyle([
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('FONTSIZE', (0, 0), (-1, 0), 9),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+], parent=_HEADER_TABLE_STYLE)
+
+@lru_cache(maxsize=None)
+def _zebra_table_style(style, row_count):
+    """style plus explicit white/zebra BACKGROUND commands for each body row"""
+    return TableStyle([
+        ('BACKGROUND', (0, row), (-1, row), _ZEBRA if row % 2 == 0 else colors.white)
+        for row in range(1, row_count)
+    ], parent=style)
+
+def _styled_table(data, col_widths, style=_HEADER_TABLE_STYLE, zebra=True, repeat_rows=1):
+    """Build a table with one of the shared, pre-built table styles"""
+    if zebra:
+        style = _zebra_table_style(style, len(data))
+    # LongTable splits long tables page by page, repeating the first repeat_rows rows on each page
+    table = LongTable(data, colWidths=col_widths, repeatRows=repeat_rows)
+    table.setStyle(style)
+    return table
+
+# Table layout cost grows faster than linearly with row count, so long tables are split
+_MAX_TABLE_ROWS = 500
+
+def _styled_tables(data, col_widths, style=_HEADER_TABLE_STYLE):
+    """Split data into tables of at most _MAX_TABLE_ROWS body rows, repeating the header row"""
+    header, rows = data[0], data[1:]
+    return [
+        _styled_table([header, *rows[start:start + _MAX_TABLE_ROWS]], col_widths, style)
+        for start in range(0, max(len(rows), 1), _MAX_TABLE_ROWS)
+    ]
+
+# ============ STATIC CONTENT ============
+# Paragraphs for the fixed lists below are parsed once at import and reused by every render
+
+def _endpoint_flowables(endpoints, gap, endpoint_style=_SUBHEADING_STYLE):
+    """Endpoint heading, description and spacer for each (endpoint, description) pair"""
+    flowables = []
+    for endpoint, desc in endpoints:
+        flowables.append(Paragraph(endpoint, endpoint_style))
+        flowables.append(Paragraph(desc, _BODY_STYLE))
+        flowables.append(Spacer(1, gap))
+    return flowables
+
+@lru_cache(maxsize=None)
+def _code_block(text):
+    """Code-style Paragraph, built once per snippet and shared by every render"""
+    return Paragraph(text, _CODE_STYLE)
+
+_TOC_ITEMS = [
+    "1. Authentication & Authorization",
+    "2. User Management",
+    "3. Medicine Store",
+    "4. Admin Store Management",
+    "5. Items Management",
+    "6. Location Services",
+    "7. Unit Management",
+    "8. GST Management",
+    "9. Orders",
+    "10. Payments",
+    "11. Notifications",
+    "12. Response Formats"
+]
+_TOC_FLOWABLES = [
+    flowable
+    for item in _TOC_ITEMS
+    for flowable in (Paragraph(item, _BODY_STYLE), Spacer(1, 0.1*inch))
+]
+
+_ADMIN_ENDPOINTS = [
+    ("GET /api/v2/admin/stores/pending", "Get all stores awaiting verification. Admin only."),
+    ("GET /api/v2/admin/stores/:storeId", "Get detailed information about a specific store for verification review."),
+    ("PUT /api/v2/admin/stores/:storeId/status", "Update store verification status (approve, reject, suspend)."),
+    ("GET /api/v2/admin/stores/stats/verification", "Get verification statistics and summary.")
+]
+_ADMIN_ENDPOINT_FLOWABLES = _endpoint_flowables(_ADMIN_ENDPOINTS, 0.1*inch)
+
+_ITEMS_ENDPOINTS = [
+    ("POST /api/v2/items/add", "Create new regular item. Requires authentication and file uploads."),
+    ("POST /api/v2/items/premium", "Create premium/featured item with enhanced visibility."),
+    ("PUT /api/v2/items/update/:itemId", "Update existing item including images."),
+    ("DELETE /api/v2/items/delete/:itemId", "Delete single item (admin only)."),
+    ("DELETE /api/v2/items/", "Delete all items (admin only - destructive operation).")
+]
+_ITEMS_ENDPOINT_FLOWABLES = _endpoint_flowables(_ITEMS_ENDPOINTS, 0.08*inch)
+
+_LOCATION_ENDPOINTS = [
+    ("GET /api/v2/location/states", "Get list of all Indian states and union territories."),
+    ("GET /api/v2/location/cities/:state", "Get list of cities for a given state."),
+    ("GET /api/v2/location/pincode/:pincode", "Get city and state information for a given pincode.")
+]
+_LOCATION_ENDPOINT_FLOWABLES = _endpoint_flowables(_LOCATION_ENDPOINTS, 0.1*inch)
+
+_PARENT_UNIT_ENDPOINTS = [
+    ("POST /api/v2/units/add-parent-units", "Create new parent unit (base measurement unit)."),
+    ("GET /api/v2/units/get-parent-units", "Get all parent units (admin only)."),
+    ("PUT /api/v2/units/update-parent-units/:id", "Update parent unit (admin only)."),
+    ("DELETE /api/v2/units/delete-parent-units/:id", "Delete parent unit (admin only).")
+]
+_PARENT_UNIT_FLOWABLES = _endpoint_flowables(
+    [(f"<b>{endpoint}</b>", desc) for endpoint, desc in _PARENT_UNIT_ENDPOINTS], 0.05*inch, _BODY_STYLE
+)
+
+_CHILD_UNIT_ENDPOINTS = [
+    ("POST /api/v2/units/add-child-units", "Create child unit (derived from parent unit)."),
+    ("GET /api/v2/units/get-child-units", "Get all child units (admin only)."),
+    ("PUT /api/v2/units/update-child-units/:id", "Update child unit (admin only)."),
+    ("DELETE /api/v2/units/delete-child-units/:id", "Delete child unit (admin only).")
+]
+_CHILD_UNIT_FLOWABLES = _endpoint_flowables(
+    [(f"<b>{endpoint}</b>", desc) for endpoint, desc in _CHILD_UNIT_ENDPOINTS], 0.05*inch, _BODY_STYLE
+)
+
+_GST_ENDPOINTS = [
+    ("POST /api/v2/gst/add", "Add new GST rate for product category."),
+    ("PUT /api/v2/gst/update/:gstId", "Update existing GST rate."),
+    ("DELETE /api/v2/gst/delete/:gstId", "Delete GST rate."),
+    ("GET /api/v2/gst/", "Get all GST rates.")
+]
+_GST_ENDPOINT_FLOWABLES = _endpoint_flowables(_GST_ENDPOINTS, 0.08*inch)
+
+_NOTIFICATION_ENDPOINTS = [
+    ("GET /api/v2/notification-service/health", "Check notification service health (public)."),
+    ("POST /api/v2/notification-service/send-to-user", "Send to authenticated user (requires auth)."),
+    ("POST /api/v2/notification-service/send-to-users", "Send to multiple users by userIds array."),
+    ("POST /api/v2/notification-service/send-bulk", "Send bulk notifications (up to 1000 users).")
+]
+_NOTIFICATION_ENDPOINT_FLOWABLES = _endpoint_flowables(_NOTIFICATION_ENDPOINTS, 0.08*inch)
+
+_FOOTER_CONTENT = """
+<b>PHRMA Production App - API Documentation v1.0</b><br/>
+<b>Generated:</b> February 17, 2026<br/>
+<b>API Version:</b> v2<br/>
+<b>Total Endpoints:</b> 30+<br/>
+<b>Support:</b> api-support@phrma.com<br/>
+<br/>
+<b>Key Features:</b><br/>
+✓ Complete REST API with JWT Authentication<br/>
+✓ Role-based Access Control (Admin, User, Manager)<br/>
+✓ Comprehensive Input Validation<br/>
+✓ Automatic Notifications for Orders & Payments<br/>
+✓ File Upload Support with Image Processing<br/>
+✓ Error Handling with Descriptive Messages<br/>
+✓ Pagination & Rate Limiting<br/>
+✓ Gateway Mode Support for Microservices
+"""
+_FOOTER_PARAGRAPH = Paragraph(_FOOTER_CONTENT, _FOOTER_STYLE)
+
+# ============ SECTIONS ============
+# Each section returns its flowables, ending with the page break that separates it from the next
+
+def _title_section():
+    """Title banner and metadata table"""
     title_data = [
-        [Paragraph("🏥 PHRMA Production App", title_style)],
-        [Paragraph("Complete API Documentation", ParagraphStyle(
-            'Subtitle', parent=styles['Normal'], fontSize=16, 
-            textColor=colors.HexColor('#FFFFFF'), alignment=TA_CENTER
-        ))]
+        [Paragraph("🏥 PHRMA Production App", _TITLE_STYLE)],
+        [Paragraph("Complete API Documentation", _SUBTITLE_STYLE)]
     ]
-    title_table = Table(title_data, colWidths=[7*inch])
-    title_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#667eea')),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 20),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 20),
-        ('TOPPADDING', (0, 0), (-1, -1), 20),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
-    ]))
-    elements.append(title_table)
-    
-    elements.append(Spacer(1, 0.5*inch))
-    
-    # Metadata
     metadata_data = [
         ['API Version', 'v2'],
         ['Generated', 'February 17, 2026'],
         ['Status', 'Active'],
         ['Endpoints', '30+']
     ]
-    metadata_table = Table(metadata_data, colWidths=[2*inch, 2*inch])
-    metadata_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f0f4ff')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#333333')),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-        ('TOPPADDING', (0, 0), (-1, -1), 12),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#ddd'))
-    ]))
-    elements.append(metadata_table)
-    
-    elements.append(PageBreak())
-    
-    # ============ TABLE OF CONTENTS ============
-    elements.append(Paragraph("📑 Table of Contents", heading_style))
-    
-    toc_items = [
-        "1. Authentication & Authorization",
-        "2. User Management",
-        "3. Medicine Store",
-        "4. Admin Store Management",
-        "5. Items Management",
-        "6. Location Services",
-        "7. Unit Management",
-        "8. GST Management",
-        "9. Orders",
-        "10. Payments",
-        "11. Notifications",
-        "12. Response Formats"
+    return [
+        Spacer(1, 1.5*inch),
+        # Background colored box for title
+        _styled_table(title_data, [7*inch], _TITLE_TABLE_STYLE, zebra=False, repeat_rows=0),
+        Spacer(1, 0.5*inch),
+        _styled_table(metadata_data, [2*inch, 2*inch], _METADATA_TABLE_STYLE, zebra=False, repeat_rows=0),
+        PageBreak(),
     ]
-    
-    for item in toc_items:
-        elements.append(Paragraph(item, body_style))
-        elements.append(Spacer(1, 0.1*inch))
-    
-    elements.append(PageBreak())
-    
-    # ============ AUTHENTICATION SECTION ============
-    elements.append(Paragraph("🔐 Authentication & Authorization", heading_style))
-    
-    elements.append(Paragraph("Authentication Methods", subheading_style))
-    
+
+def _toc_section():
+    """Table of contents"""
+    return [
+        Paragraph("📑 Table of Contents", _HEADING_STYLE),
+        *_TOC_FLOWABLES,
+        PageBreak(),
+    ]
+
+def _auth_section():
+    """Authentication methods, required headers and user roles"""
     auth_data = [
         ['Method', 'Description', 'Usage'],
         ['JWT Token', 'Bearer token in Authorization header or cookie', 'Authorization: Bearer {token}'],
         ['Gateway Mode', 'Headers from API Gateway', 'X-User-ID, X-User-Role, X-User-Email']
     ]
-    auth_table = Table(auth_data, colWidths=[1.5*inch, 2.5*inch, 2.5*inch])
-    auth_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('TOPPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f9f9f9')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#ddd')),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')])
-    ]))
-    elements.append(auth_table)
-    elements.append(Spacer(1, 0.2*inch))
-    
-    elements.append(Paragraph("Required Headers", subheading_style))
-    
     headers_data = [
         ['Header', 'Type', 'Description'],
         ['Content-Type', 'application/json', 'Required for POST/PUT requests'],
@@ -192,121 +414,80 @@ def create_api_pdf():
         ['X-User-ID', 'String (UUID)', 'Optional (Gateway mode)'],
         ['X-User-Role', 'admin|user|manager', 'Optional (Gateway mode)']
     ]
-    headers_table = Table(headers_data, colWidths=[1.8*inch, 2.2*inch, 2.5*inch])
-    headers_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f9f9f9')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#ddd')),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')])
-    ]))
-    elements.append(headers_table)
-    elements.append(Spacer(1, 0.2*inch))
-    
-    elements.append(Paragraph("User Roles & Permissions", subheading_style))
-    
     roles_data = [
         ['Role', 'Permissions', 'Endpoints Access'],
         ['admin', 'Full access, verification, store management', '/admin/*, /units/*, /gst/*'],
         ['user', 'Regular user, can manage own store', '/medicine-store/*, /items/*, /orders/*'],
         ['manager', 'Store manager, manages items and orders', '/items/*, /orders/*, /payments/*']
     ]
-    roles_table = Table(roles_data, colWidths=[1.2*inch, 2.5*inch, 2.8*inch])
-    roles_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f9f9f9')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#ddd')),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')])
-    ]))
-    elements.append(roles_table)
-    
-    elements.append(PageBreak())
-    
-    # ============ USER ENDPOINTS ============
-    elements.append(Paragraph("👤 User Management Endpoints", heading_style))
-    
-    # Login Endpoint
-    elements.append(Paragraph("POST /api/v2/user/login", subheading_style))
-    elements.append(Paragraph("Authenticate user with email and password. Returns JWT token for subsequent requests.", body_style))
-    
+    return [
+        Paragraph("🔐 Authentication & Authorization", _HEADING_STYLE),
+        Paragraph("Authentication Methods", _SUBHEADING_STYLE),
+        _styled_table(auth_data, [1.5*inch, 2.5*inch, 2.5*inch], _AUTH_TABLE_STYLE),
+        Spacer(1, 0.2*inch),
+        Paragraph("Required Headers", _SUBHEADING_STYLE),
+        _styled_table(headers_data, [1.8*inch, 2.2*inch, 2.5*inch], _HEADERS_TABLE_STYLE),
+        Spacer(1, 0.2*inch),
+        Paragraph("User Roles & Permissions", _SUBHEADING_STYLE),
+        _styled_table(roles_data, [1.2*inch, 2.5*inch, 2.8*inch], _ROLES_TABLE_STYLE),
+        PageBreak(),
+    ]
+
+def _user_section():
+    """User login, logout and password reset endpoints"""
     login_request = """Request Body:
 - email (String, Required): User email address
 - password (String, Required): User password (minimum 8 characters)
 - fcmToken (String, Optional): Firebase Cloud Messaging token for push notifications"""
-    elements.append(Paragraph(login_request, code_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
     login_json = """{"email": "user@example.com", "password": "securePassword123", "fcmToken": "eO...K1"}"""
-    elements.append(Paragraph("Request Example:", subheading_style))
-    elements.append(Paragraph(login_json, code_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    elements.append(Paragraph("Success Response (200 OK):", body_style))
     success_response = """{"status": 200, "message": "Login Successful", "data": {"user": {"_id": "507f1f77bcf86cd799439011", "name": "John Doe", "email": "user@example.com", "phone": "+919876543210", "role": "user", "token": "eyJhbGc...iOiJIUzI1NiIsInR5cCI6IkpXVCJ9"}}"""
-    elements.append(Paragraph(success_response, code_style))
-    elements.append(Spacer(1, 0.15*inch))
-    
-    req_box = Paragraph(
-        "<b>Requirements:</b><br/>✓ Email must be valid format<br/>✓ Password must be at least 8 characters<br/>✓ User must be registered in the system<br/>✓ Account must not be suspended",
-        ParagraphStyle('ReqBox', parent=styles['Normal'], fontSize=9, 
-                      textColor=colors.HexColor('#333'), backColor=colors.HexColor('#fff3cd'),
-                      leftIndent=10, spaceAfter=10, borderPadding=10)
-    )
-    elements.append(req_box)
-    elements.append(Spacer(1, 0.1*inch))
-    
-    # Logout Endpoint
-    elements.append(Paragraph("POST /api/v2/user/logout", subheading_style))
-    elements.append(Paragraph("Logout user by invalidating the JWT token. Clears authentication cookie.", body_style))
-    elements.append(Paragraph("<b>Authentication Required:</b> Bearer Token or Valid JWT Cookie", 
-                            ParagraphStyle('Auth', parent=styles['Normal'], fontSize=9,
-                                          textColor=colors.HexColor('#721c24'), 
-                                          backColor=colors.HexColor('#f8d7da'),
-                                          leftIndent=10, spaceAfter=10)))
-    elements.append(Spacer(1, 0.2*inch))
-    
-    # Forgot Password
-    elements.append(Paragraph("POST /api/v2/user/forgot/password", subheading_style))
-    elements.append(Paragraph("Request password reset. Sends OTP to registered email address.", body_style))
-    elements.append(Paragraph("Request Body: email (String, Required)", code_style))
-    elements.append(Spacer(1, 0.15*inch))
-    
-    # Verify OTP
-    elements.append(Paragraph("POST /api/v2/user/verifyOtp", subheading_style))
-    elements.append(Paragraph("Verify OTP sent to email for password reset.", body_style))
-    elements.append(Paragraph("Request Body: email (String, Required), otp (String, Required)", code_style))
-    elements.append(Spacer(1, 0.15*inch))
-    
-    # Reset Password
-    elements.append(Paragraph("POST /api/v2/user/ResetPassword", subheading_style))
-    elements.append(Paragraph("Reset user password after OTP verification. Internal service only.", body_style))
-    elements.append(Paragraph("<b>Requires:</b> verifyInternalService Middleware", 
-                            ParagraphStyle('Auth', parent=styles['Normal'], fontSize=9,
-                                          textColor=colors.HexColor('#721c24'),
-                                          backColor=colors.HexColor('#f8d7da'),
-                                          leftIndent=10, spaceAfter=10)))
-    
-    elements.append(PageBreak())
-    
-    # ============ MEDICINE STORE ============
-    elements.append(Paragraph("💊 Medicine Store Endpoints", heading_style))
-    
-    elements.append(Paragraph("POST /api/v2/medicine-store/register", subheading_style))
-    elements.append(Paragraph("Register a new medicine store with complete verification including GST, pharmacy license, and address validation.", body_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
+    return [
+        Paragraph("👤 User Management Endpoints", _HEADING_STYLE),
+    
+        # Login Endpoint
+        Paragraph("POST /api/v2/user/login", _SUBHEADING_STYLE),
+        Paragraph("Authenticate user with email and password. Returns JWT token for subsequent requests.", _BODY_STYLE),
+        _code_block(login_request),
+        Spacer(1, 0.1*inch),
+        Paragraph("Request Example:", _SUBHEADING_STYLE),
+        _code_block(login_json),
+        Spacer(1, 0.1*inch),
+        Paragraph("Success Response (200 OK):", _BODY_STYLE),
+        _code_block(success_response),
+        Spacer(1, 0.15*inch),
+        Paragraph(
+            "<b>Requirements:</b><br/>✓ Email must be valid format<br/>✓ Password must be at least 8 characters<br/>✓ User must be registered in the system<br/>✓ Account must not be suspended",
+            _LOGIN_REQ_BOX_STYLE
+        ),
+        Spacer(1, 0.1*inch),
+    
+        # Logout Endpoint
+        Paragraph("POST /api/v2/user/logout", _SUBHEADING_STYLE),
+        Paragraph("Logout user by invalidating the JWT token. Clears authentication cookie.", _BODY_STYLE),
+        Paragraph("<b>Authentication Required:</b> Bearer Token or Valid JWT Cookie", _AUTH_STYLE),
+        Spacer(1, 0.2*inch),
+    
+        # Forgot Password
+        Paragraph("POST /api/v2/user/forgot/password", _SUBHEADING_STYLE),
+        Paragraph("Request password reset. Sends OTP to registered email address.", _BODY_STYLE),
+        _code_block("Request Body: email (String, Required)"),
+        Spacer(1, 0.15*inch),
+    
+        # Verify OTP
+        Paragraph("POST /api/v2/user/verifyOtp", _SUBHEADING_STYLE),
+        Paragraph("Verify OTP sent to email for password reset.", _BODY_STYLE),
+        _code_block("Request Body: email (String, Required), otp (String, Required)"),
+        Spacer(1, 0.15*inch),
+    
+        # Reset Password
+        Paragraph("POST /api/v2/user/ResetPassword", _SUBHEADING_STYLE),
+        Paragraph("Reset user password after OTP verification. Internal service only.", _BODY_STYLE),
+        Paragraph("<b>Requires:</b> verifyInternalService Middleware", _AUTH_STYLE),
+        PageBreak(),
+    ]
+
+def _store_section():
+    """Medicine store registration"""
     store_req_data = [
         ['Field', 'Type', 'Required', 'Validation'],
         ['userName', 'String', 'Yes', 'Name of store owner'],
@@ -321,287 +502,164 @@ def create_api_pdf():
         ['state', 'String', 'Yes', 'Must match pincode'],
         ['pincode', 'String', 'Yes', '6-digit Indian pincode']
     ]
-    store_req_table = Table(store_req_data, colWidths=[1.2*inch, 1*inch, 0.8*inch, 2.3*inch])
-    store_req_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 9),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-        ('TOPPADDING', (0, 0), (-1, 0), 8),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f9f9f9')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#ddd')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')])
-    ]))
-    elements.append(store_req_table)
-    elements.append(Spacer(1, 0.15*inch))
-    
     store_json = """{"userName": "Dr. Rajesh Kumar", "email": "rajesh.med@example.com", "phone": "9876543210", "storeName": "Apollo Pharmacy", "storeType": "retail", "GSTNumber": "27AABCU9603R1Z0", "pharmacyLicence": "PL2024000123", "address": "Plot 123, Medical Complex", "city": "Bangalore", "state": "Karnataka", "pincode": "560034"}"""
-    elements.append(Paragraph("Request Example:", subheading_style))
-    elements.append(Paragraph(store_json, code_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    val_req = Paragraph(
-        "<b>Validation Requirements:</b><br/>✓ GST format validation<br/>✓ Phone: 10-11 digits, valid Indian format<br/>✓ Pharmacy License valid for state<br/>✓ Pincode must match city and state<br/>✓ Email must be unique<br/>✓ Store enters 'pending' verification status",
-        ParagraphStyle('ReqBox', parent=styles['Normal'], fontSize=9,
-                      textColor=colors.HexColor('#333'), backColor=colors.HexColor('#fff3cd'),
-                      leftIndent=10, spaceAfter=10)
-    )
-    elements.append(val_req)
-    
-    elements.append(PageBreak())
-    
-    # ============ ADMIN STORE ============
-    elements.append(Paragraph("⚙️ Admin Store Management", heading_style))
-    
-    admin_endpoints = [
-        ("GET /api/v2/admin/stores/pending", "Get all stores awaiting verification. Admin only."),
-        ("GET /api/v2/admin/stores/:storeId", "Get detailed information about a specific store for verification review."),
-        ("PUT /api/v2/admin/stores/:storeId/status", "Update store verification status (approve, reject, suspend)."),
-        ("GET /api/v2/admin/stores/stats/verification", "Get verification statistics and summary.")
+    return [
+        Paragraph("💊 Medicine Store Endpoints", _HEADING_STYLE),
+        Paragraph("POST /api/v2/medicine-store/register", _SUBHEADING_STYLE),
+        Paragraph("Register a new medicine store with complete verification including GST, pharmacy license, and address validation.", _BODY_STYLE),
+        Spacer(1, 0.1*inch),
+        _styled_table(store_req_data, [1.2*inch, 1*inch, 0.8*inch, 2.3*inch], _COMPACT_HEADER_TABLE_STYLE),
+        Spacer(1, 0.15*inch),
+        Paragraph("Request Example:", _SUBHEADING_STYLE),
+        _code_block(store_json),
+        Spacer(1, 0.1*inch),
+        Paragraph(
+            "<b>Validation Requirements:</b><br/>✓ GST format validation<br/>✓ Phone: 10-11 digits, valid Indian format<br/>✓ Pharmacy License valid for state<br/>✓ Pincode must match city and state<br/>✓ Email must be unique<br/>✓ Store enters 'pending' verification status",
+            _REQ_BOX_STYLE
+        ),
+        PageBreak(),
     ]
-    
-    for endpoint, desc in admin_endpoints:
-        elements.append(Paragraph(endpoint, subheading_style))
-        elements.append(Paragraph(desc, body_style))
-        elements.append(Spacer(1, 0.1*inch))
-    
-    elements.append(Paragraph("Status Update Body:", subheading_style))
+
+def _admin_store_section():
+    """Admin store verification endpoints"""
     status_json = """{"action": "approve", "adminRemarks": "All documents verified successfully"}
 Valid actions: approve|reject|suspend"""
-    elements.append(Paragraph(status_json, code_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    admin_req = Paragraph(
-        "<b>Requirements:</b><br/>✓ User must have admin role<br/>✓ For reject/suspend, adminRemarks is mandatory<br/>✓ Once approved, store can add items and process orders",
-        ParagraphStyle('ReqBox', parent=styles['Normal'], fontSize=9,
-                      textColor=colors.HexColor('#333'), backColor=colors.HexColor('#fff3cd'),
-                      leftIndent=10, spaceAfter=10)
-    )
-    elements.append(admin_req)
-    
-    elements.append(PageBreak())
-    
-    # ============ ITEMS ============
-    elements.append(Paragraph("📦 Items Management", heading_style))
-    
-    items_endpoints = [
-        ("POST /api/v2/items/add", "Create new regular item. Requires authentication and file uploads."),
-        ("POST /api/v2/items/premium", "Create premium/featured item with enhanced visibility."),
-        ("PUT /api/v2/items/update/:itemId", "Update existing item including images."),
-        ("DELETE /api/v2/items/delete/:itemId", "Delete single item (admin only)."),
-        ("DELETE /api/v2/items/", "Delete all items (admin only - destructive operation).")
+    return [
+        Paragraph("⚙️ Admin Store Management", _HEADING_STYLE),
+        *_ADMIN_ENDPOINT_FLOWABLES,
+        Paragraph("Status Update Body:", _SUBHEADING_STYLE),
+        _code_block(status_json),
+        Spacer(1, 0.1*inch),
+        Paragraph(
+            "<b>Requirements:</b><br/>✓ User must have admin role<br/>✓ For reject/suspend, adminRemarks is mandatory<br/>✓ Once approved, store can add items and process orders",
+            _REQ_BOX_STYLE
+        ),
+        PageBreak(),
     ]
-    
-    for endpoint, desc in items_endpoints:
-        elements.append(Paragraph(endpoint, subheading_style))
-        elements.append(Paragraph(desc, body_style))
-        elements.append(Spacer(1, 0.08*inch))
-    
-    elements.append(Spacer(1, 0.1*inch))
-    
-    items_req = Paragraph(
-        "<b>Item Requirements:</b><br/>✓ User must be authenticated<br/>✓ Must have associated medicine store<br/>✓ Store must be verified/approved<br/>✓ Images: JPEG/PNG, max 5MB each<br/>✓ Price > 0, Quantity ≥ 0",
-        ParagraphStyle('ReqBox', parent=styles['Normal'], fontSize=9,
-                      textColor=colors.HexColor('#333'), backColor=colors.HexColor('#fff3cd'),
-                      leftIndent=10, spaceAfter=10)
-    )
-    elements.append(items_req)
-    
-    elements.append(PageBreak())
-    
-    # ============ LOCATION ============
-    elements.append(Paragraph("🗺️ Location Services", heading_style))
-    
-    loc_endpoints = [
-        ("GET /api/v2/location/states", "Get list of all Indian states and union territories."),
-        ("GET /api/v2/location/cities/:state", "Get list of cities for a given state."),
-        ("GET /api/v2/location/pincode/:pincode", "Get city and state information for a given pincode.")
+
+def _items_section():
+    """Item management endpoints"""
+    return [
+        Paragraph("📦 Items Management", _HEADING_STYLE),
+        *_ITEMS_ENDPOINT_FLOWABLES,
+        Spacer(1, 0.1*inch),
+        Paragraph(
+            "<b>Item Requirements:</b><br/>✓ User must be authenticated<br/>✓ Must have associated medicine store<br/>✓ Store must be verified/approved<br/>✓ Images: JPEG/PNG, max 5MB each<br/>✓ Price > 0, Quantity ≥ 0",
+            _REQ_BOX_STYLE
+        ),
+        PageBreak(),
     ]
-    
-    for endpoint, desc in loc_endpoints:
-        elements.append(Paragraph(endpoint, subheading_style))
-        elements.append(Paragraph(desc, body_style))
-        elements.append(Spacer(1, 0.1*inch))
-    
+
+def _location_section():
+    """Public location lookup endpoints"""
     pincode_example = """Example: /api/v2/location/pincode/560034
 Response: {"status": 200, "data": {"pincode": "560034", "city": "Bangalore", "state": "Karnataka"}}"""
-    elements.append(Paragraph(pincode_example, code_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    elements.append(Paragraph("<b>Note:</b> Public endpoints, no authentication required.", 
-                            ParagraphStyle('Note', parent=styles['Normal'], fontSize=9,
-                                          textColor=colors.HexColor('#0066cc'),
-                                          backColor=colors.HexColor('#e7f3ff'),
-                                          leftIndent=10, spaceAfter=10)))
-    
-    elements.append(PageBreak())
-    
-    # ============ UNITS ============
-    elements.append(Paragraph("📏 Unit Management", heading_style))
-    
-    elements.append(Paragraph("Parent Units (e.g., Kilogram, Liter)", subheading_style))
-    
-    parent_units = [
-        ("POST /api/v2/units/add-parent-units", "Create new parent unit (base measurement unit)."),
-        ("GET /api/v2/units/get-parent-units", "Get all parent units (admin only)."),
-        ("PUT /api/v2/units/update-parent-units/:id", "Update parent unit (admin only)."),
-        ("DELETE /api/v2/units/delete-parent-units/:id", "Delete parent unit (admin only).")
-    ]
-    
-    for endpoint, desc in parent_units:
-        elements.append(Paragraph(f"<b>{endpoint}</b>", body_style))
-        elements.append(Paragraph(desc, body_style))
-        elements.append(Spacer(1, 0.05*inch))
-    
-    elements.append(Spacer(1, 0.15*inch))
-    elements.append(Paragraph("Child Units (e.g., 100ml, 500g)", subheading_style))
-    
-    child_units = [
-        ("POST /api/v2/units/add-child-units", "Create child unit (derived from parent unit)."),
-        ("GET /api/v2/units/get-child-units", "Get all child units (admin only)."),
-        ("PUT /api/v2/units/update-child-units/:id", "Update child unit (admin only)."),
-        ("DELETE /api/v2/units/delete-child-units/:id", "Delete child unit (admin only).")
+    return [
+        Paragraph("🗺️ Location Services", _HEADING_STYLE),
+        *_LOCATION_ENDPOINT_FLOWABLES,
+        _code_block(pincode_example),
+        Spacer(1, 0.1*inch),
+        Paragraph("<b>Note:</b> Public endpoints, no authentication required.", _NOTE_STYLE),
+        PageBreak(),
     ]
-    
-    for endpoint, desc in child_units:
-        elements.append(Paragraph(f"<b>{endpoint}</b>", body_style))
-        elements.append(Paragraph(desc, body_style))
-        elements.append(Spacer(1, 0.05*inch))
-    
-    elements.append(Spacer(1, 0.1*inch))
-    
+
+def _units_section():
+    """Parent and child unit endpoints"""
     child_json = """Child Unit Example:
 {"childUnitName": "100 Milliliters", "childUnitSymbol": "100ml", "parentUnitId": "507f...", "conversionFactor": 0.1}"""
-    elements.append(Paragraph(child_json, code_style))
-    
-    elements.append(PageBreak())
-    
-    # ============ GST ============
-    elements.append(Paragraph("💰 GST Rate Management", heading_style))
-    
-    gst_endpoints = [
-        ("POST /api/v2/gst/add", "Add new GST rate for product category."),
-        ("PUT /api/v2/gst/update/:gstId", "Update existing GST rate."),
-        ("DELETE /api/v2/gst/delete/:gstId", "Delete GST rate."),
-        ("GET /api/v2/gst/", "Get all GST rates.")
+    return [
+        Paragraph("📏 Unit Management", _HEADING_STYLE),
+        Paragraph("Parent Units (e.g., Kilogram, Liter)", _SUBHEADING_STYLE),
+        *_PARENT_UNIT_FLOWABLES,
+        Spacer(1, 0.15*inch),
+        Paragraph("Child Units (e.g., 100ml, 500g)", _SUBHEADING_STYLE),
+        *_CHILD_UNIT_FLOWABLES,
+        Spacer(1, 0.1*inch),
+        _code_block(child_json),
+        PageBreak(),
     ]
-    
-    for endpoint, desc in gst_endpoints:
-        elements.append(Paragraph(endpoint, subheading_style))
-        elements.append(Paragraph(desc, body_style))
-        elements.append(Spacer(1, 0.08*inch))
-    
+
+def _gst_section():
+    """GST rate endpoints"""
     gst_json = """Add GST Example:
 {"productCategory": "Medicines", "gstRate": 5, "description": "GST rate for medicines and pharmaceuticals"}
 
 Valid rates in India: 0%, 5%, 12%, 18%, 28%"""
-    elements.append(Paragraph(gst_json, code_style))
-    
-    elements.append(PageBreak())
-    
-    # ============ ORDERS ============
-    elements.append(Paragraph("📋 Orders", heading_style))
-    
-    elements.append(Paragraph("POST /api/v2/orders", subheading_style))
-    elements.append(Paragraph("Create new order with automatic notification to user.", body_style))
-    
+    return [
+        Paragraph("💰 GST Rate Management", _HEADING_STYLE),
+        *_GST_ENDPOINT_FLOWABLES,
+        _code_block(gst_json),
+        PageBreak(),
+    ]
+
+def _orders_section():
+    """Order creation and status endpoints"""
     order_fields = """Request Body:
 - userId (String, Required): User ID
 - items (Array, Required): Order items with quantity and price
 - totalAmount (Number, Required): Order total
 - deliveryAddress (String, Optional): Delivery address"""
-    elements.append(Paragraph(order_fields, code_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
     order_json = """{"userId": "507f...", "items": [{"itemId": "507f...", "quantity": 2, "price": 299}], "totalAmount": 598, "deliveryAddress": "123 Main St, Bangalore"}"""
-    elements.append(Paragraph(order_json, code_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    elements.append(Paragraph("PATCH /api/v2/orders/:orderId/status", subheading_style))
-    elements.append(Paragraph("Update order status and notify user.", body_style))
-    
     order_status = """Status Flow: pending → processing → shipped → delivered → cancelled
 
 Example: {"status": "shipped", "userId": "507f..."}"""
-    elements.append(Paragraph(order_status, code_style))
-    
-    elements.append(PageBreak())
-    
-    # ============ PAYMENTS ============
-    elements.append(Paragraph("💳 Payments", heading_style))
-    
-    elements.append(Paragraph("POST /api/v2/payments", subheading_style))
-    elements.append(Paragraph("Process payment and send confirmation notification.", body_style))
-    
+    return [
+        Paragraph("📋 Orders", _HEADING_STYLE),
+        Paragraph("POST /api/v2/orders", _SUBHEADING_STYLE),
+        Paragraph("Create new order with automatic notification to user.", _BODY_STYLE),
+        _code_block(order_fields),
+        Spacer(1, 0.1*inch),
+        _code_block(order_json),
+        Spacer(1, 0.1*inch),
+        Paragraph("PATCH /api/v2/orders/:orderId/status", _SUBHEADING_STYLE),
+        Paragraph("Update order status and notify user.", _BODY_STYLE),
+        _code_block(order_status),
+        PageBreak(),
+    ]
+
+def _payments_section():
+    """Payment, refund and failure endpoints"""
     payment_fields = """Request Body:
 - userId (String, Required)
 - orderId (String, Required)
 - amount (Number, Required)
 - paymentMethod (String, Required): credit_card|debit_card|upi|net_banking"""
-    elements.append(Paragraph(payment_fields, code_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    elements.append(Paragraph("POST /api/v2/payments/:paymentId/refund", subheading_style))
-    elements.append(Paragraph("Process refund. Reflects in 5-7 business days.", body_style))
-    
     refund_json = """{"userId": "507f...", "amount": 598, "reason": "Order cancelled by customer"}"""
-    elements.append(Paragraph(refund_json, code_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    elements.append(Paragraph("POST /api/v2/payments/failed", subheading_style))
-    elements.append(Paragraph("Handle failed payment and notify user.", body_style))
-    
-    elements.append(PageBreak())
-    
-    # ============ NOTIFICATIONS ============
-    elements.append(Paragraph("🔔 Notifications", heading_style))
-    
-    notif_endpoints = [
-        ("GET /api/v2/notification-service/health", "Check notification service health (public)."),
-        ("POST /api/v2/notification-service/send-to-user", "Send to authenticated user (requires auth)."),
-        ("POST /api/v2/notification-service/send-to-users", "Send to multiple users by userIds array."),
-        ("POST /api/v2/notification-service/send-bulk", "Send bulk notifications (up to 1000 users).")
+    return [
+        Paragraph("💳 Payments", _HEADING_STYLE),
+        Paragraph("POST /api/v2/payments", _SUBHEADING_STYLE),
+        Paragraph("Process payment and send confirmation notification.", _BODY_STYLE),
+        _code_block(payment_fields),
+        Spacer(1, 0.1*inch),
+        Paragraph("POST /api/v2/payments/:paymentId/refund", _SUBHEADING_STYLE),
+        Paragraph("Process refund. Reflects in 5-7 business days.", _BODY_STYLE),
+        _code_block(refund_json),
+        Spacer(1, 0.1*inch),
+        Paragraph("POST /api/v2/payments/failed", _SUBHEADING_STYLE),
+        Paragraph("Handle failed payment and notify user.", _BODY_STYLE),
+        PageBreak(),
     ]
-    
-    for endpoint, desc in notif_endpoints:
-        elements.append(Paragraph(endpoint, subheading_style))
-        elements.append(Paragraph(desc, body_style))
-        elements.append(Spacer(1, 0.08*inch))
-    
+
+def _notifications_section():
+    """Notification service endpoints"""
     notif_json = """Notification Body:
 {"title": "Order Confirmed", "body": "Your order #ORD123 has been confirmed", "data": {"orderId": "ORD123", "screen": "OrderDetails"}}"""
-    elements.append(Paragraph(notif_json, code_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    notif_req = Paragraph(
-        "<b>Notification Requirements:</b><br/>✓ Title under 100 characters<br/>✓ Body should be brief and meaningful<br/>✓ Data object optional with custom properties<br/>✓ Bulk: up to 1000 userIds per request",
-        ParagraphStyle('ReqBox', parent=styles['Normal'], fontSize=9,
-                      textColor=colors.HexColor('#333'), backColor=colors.HexColor('#fff3cd'),
-                      leftIndent=10, spaceAfter=10)
-    )
-    elements.append(notif_req)
-    
-    elements.append(PageBreak())
-    
-    # ============ RESPONSE FORMATS ============
-    elements.append(Paragraph("📊 Standard Response Formats", heading_style))
-    
-    elements.append(Paragraph("Success Response (2xx)", subheading_style))
+    return [
+        Paragraph("🔔 Notifications", _HEADING_STYLE),
+        *_NOTIFICATION_ENDPOINT_FLOWABLES,
+        _code_block(notif_json),
+        Spacer(1, 0.1*inch),
+        Paragraph(
+            "<b>Notification Requirements:</b><br/>✓ Title under 100 characters<br/>✓ Body should be brief and meaningful<br/>✓ Data object optional with custom properties<br/>✓ Bulk: up to 1000 userIds per request",
+            _REQ_BOX_STYLE
+        ),
+        PageBreak(),
+    ]
+
+def _response_formats_section():
+    """Response envelopes, HTTP status codes, pagination and rate limiting"""
     success_fmt = """{"status": 200, "message": "Operation completed successfully", "data": {...}}"""
-    elements.append(Paragraph(success_fmt, code_style))
-    elements.append(Spacer(1, 0.15*inch))
-    
-    elements.append(Paragraph("Error Response (4xx/5xx)", subheading_style))
     error_fmt = """{"status": 400, "message": "Error description", "error": {"code": "ERROR_CODE", "details": "..."}}"""
-    elements.append(Paragraph(error_fmt, code_style))
-    elements.append(Spacer(1, 0.15*inch))
-    
-    elements.append(Paragraph("HTTP Status Codes", subheading_style))
-    
     status_data = [
         ['Code', 'Meaning', 'Scenarios'],
         ['200', 'OK', 'Successful GET/PATCH'],
@@ -613,25 +671,6 @@ Example: {"status": "shipped", "userId": "507f..."}"""
         ['409', 'Conflict', 'Duplicate resource'],
         ['500', 'Server Error', 'Internal server error']
     ]
-    status_table = Table(status_data, colWidths=[0.8*inch, 1.5*inch, 3.2*inch])
-    status_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-        ('TOPPADDING', (0, 0), (-1, 0), 8),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f9f9f9')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#ddd')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')])
-    ]))
-    elements.append(status_table)
-    elements.append(Spacer(1, 0.2*inch))
-    
-    elements.append(Paragraph("Pagination & Rate Limiting", subheading_style))
-    
     pagination_data = [
         ['Parameter/Header', 'Type', 'Description'],
         ['skip', 'Number', 'Records to skip (default: 0)'],
@@ -640,66 +679,180 @@ Example: {"status": "shipped", "userId": "507f..."}"""
         ['X-RateLimit-Remaining', 'Number', 'Remaining requests in window'],
         ['X-RateLimit-Reset', 'Timestamp', 'When limit resets']
     ]
-    pagination_table = Table(pagination_data, colWidths=[2*inch, 1.2*inch, 2.8*inch])
-    pagination_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-        ('TOPPADDING', (0, 0), (-1, 0), 8),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f9f9f9')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#ddd')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')])
-    ]))
-    elements.append(pagination_table)
-    
-    elements.append(PageBreak())
-    
-    # ============ FOOTER ============
-    footer_content = """
-    <b>PHRMA Production App - API Documentation v1.0</b><br/>
-    <b>Generated:</b> February 17, 2026<br/>
-    <b>API Version:</b> v2<br/>
-    <b>Total Endpoints:</b> 30+<br/>
-    <b>Support:</b> api-support@phrma.com<br/>
-    <br/>
-    <b>Key Features:</b><br/>
-    ✓ Complete REST API with JWT Authentication<br/>
-    ✓ Role-based Access Control (Admin, User, Manager)<br/>
-    ✓ Comprehensive Input Validation<br/>
-    ✓ Automatic Notifications for Orders & Payments<br/>
-    ✓ File Upload Support with Image Processing<br/>
-    ✓ Error Handling with Descriptive Messages<br/>
-    ✓ Pagination & Rate Limiting<br/>
-    ✓ Gateway Mode Support for Microservices
-    """
+    return [
+        Paragraph("📊 Standard Response Formats", _HEADING_STYLE),
+        Paragraph("Success Response (2xx)", _SUBHEADING_STYLE),
+        _code_block(success_fmt),
+        Spacer(1, 0.15*inch),
+        Paragraph("Error Response (4xx/5xx)", _SUBHEADING_STYLE),
+        _code_block(error_fmt),
+        Spacer(1, 0.15*inch),
+        Paragraph("HTTP Status Codes", _SUBHEADING_STYLE),
+        _styled_table(status_data, [0.8*inch, 1.5*inch, 3.2*inch]),
+        Spacer(1, 0.2*inch),
+        Paragraph("Pagination & Rate Limiting", _SUBHEADING_STYLE),
+        *_styled_tables(pagination_data, [2*inch, 1.2*inch, 2.8*inch]),
+        PageBreak(),
+    ]
+
+def _footer_section():
+    """Closing summary page"""
+    return [_FOOTER_PARAGRAPH]
+
+# Document order; the content of every section is static
+_SECTIONS = (
+    _title_section,
+    _toc_section,
+    _auth_section,
+    _user_section,
+    _store_section,
+    _admin_store_section,
+    _items_section,
+    _location_section,
+    _units_section,
+    _gst_section,
+    _orders_section,
+    _payments_section,
+    _notifications_section,
+    _response_formats_section,
+    _footer_section,
+)
+
+def _build_elements():
+    """Assemble the flowables of every section in document order"""
+    return list(chain.from_iterable(section() for section in _SECTIONS))
+
+def _render_api_pdf():
+    """Lay out the API documentation and return the PDF bytes"""
     
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=9,
-        textColor=colors.HexColor('#666'),
-        spaceAfter=10,
-        alignment=TA_CENTER
+    # Create PDF document in memory
+    buffer = BytesIO()
+    doc = BaseDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=15*mm,
+        leftMargin=15*mm,
+        topMargin=20*mm,
+        bottomMargin=20*mm,
+        title="PHRMA API Documentation",
+        # Flate-compress page content streams regardless of local rl_config overrides
+        pageCompression=1,
+        # Fixed creation date and document ID, so unchanged content gives identical bytes
+        invariant=1
     )
-    elements.append(Paragraph(footer_content, footer_style))
+    # A single template for every page, instead of SimpleDocTemplate's First/Later pair
+    frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='main')
+    doc.addPageTemplates([PageTemplate(id='main', frames=[frame])])
     
     # Build PDF
-    print("🚀 Generating PDF...")
-    doc.build(elements)
-    
-    print(f"✅ PDF generated successfully: {pdf_filename}")
-    print(f"📊 The PDF contains:")
-    print("   • Complete API documentation")
-    print("   • 30+ endpoints with examples")
-    print("   • Request/Response formats")
-    print("   • Authentication methods")
-    print("   • Validation requirements")
-    print("   • HTTP status codes")
-    print("   • Professional formatting")
+    logger.info("🚀 Generating PDF...")
+    doc.build(_build_elements())
+    return buffer.getvalue()
+
+# Emoji status markers (plus a trailing variation selector/space), dropped when stdout is not a terminal
+_EMOJI_PATTERN = re.compile('[\u2600-\u27bf\U0001f300-\U0001faff]\ufe0f? ?')
+
+def _emit(text):
+    """Write status text to stdout in one call; plain text and raw UTF-8 bytes when piped"""
+    if sys.stdout.isatty():
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    text = _EMOJI_PATTERN.sub('', text)
+    # In-memory streams (redirect_stdout, pytest capture, notebooks) have no byte layer
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    # Encode once and bypass the text layer, so a non-UTF-8 locale can't raise UnicodeEncodeError
+    sys.stdout.flush()
+    buffer.write(text.encode('utf-8', errors='replace'))
+    buffer.flush()
+
+class _StatusHandler(logging.Handler):
+    """Logging handler that hands each formatted record to _emit()"""
+    
+    def emit(self, record):
+        try:
+            _emit(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+def _write_atomic(path, data):
+    """Write data to a private temp file beside path, then swap it into place"""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _cached_pdf_path():
+    """Cache location for the PDF rendered from this exact source and ReportLab version, or None"""
+    try:
+        digest = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16)
+        cache_home = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    except (OSError, RuntimeError):
+        # Unreadable source or no home directory: render without the cache
+        return None
+    if not cache_home.is_absolute():
+        # Without HOME, Path.home() can come back as a literal '~' relative to the working directory
+        return None
+    digest.update(_REPORTLAB_VERSION.encode())
+    return cache_home / _CACHE_DIRNAME / f"{digest.hexdigest()}.pdf"
+
+def _load_cached_pdf(cache_path):
+    """Return the rendered PDF stored at cache_path, or None if it is missing or unreadable"""
+    try:
+        return cache_path.read_bytes()
+    except OSError:
+        return None
+
+def create_api_pdf(pdf_filename="API_DOCUMENTATION.pdf"):
+    """Generate API documentation PDF"""
+    global _CACHED_PDF_BYTES
+    
+    with _RENDER_LOCK:
+        if _CACHED_PDF_BYTES is None:
+            cache_path = _cached_pdf_path()
+            if cache_path is not None:
+                _CACHED_PDF_BYTES = _load_cached_pdf(cache_path)
+            if _CACHED_PDF_BYTES is None:
+                _CACHED_PDF_BYTES = _render_api_pdf()
+                if cache_path is not None:
+                    try:
+                        cache_path.parent.mkdir(parents=True, exist_ok=True)
+                        _write_atomic(cache_path, _CACHED_PDF_BYTES)
+                    except OSError:
+                        # The cache is only an optimisation; a read-only home still gets its PDF
+                        pass
+    
+    _write_atomic(pdf_filename, _CACHED_PDF_BYTES)
+    
+    # One record for the whole summary; formatting is deferred until a handler consumes it
+    logger.info(
+        "✅ PDF generated successfully: %s\n"
+        "📊 The PDF contains:\n"
+        "   • Complete API documentation\n"
+        "   • 30+ endpoints with examples\n"
+        "   • Request/Response formats\n"
+        "   • Authentication methods\n"
+        "   • Validation requirements\n"
+        "   • HTTP status codes\n"
+        "   • Professional formatting",
+        pdf_filename
+    )
+
+async def create_api_pdf_async(pdf_filename="API_DOCUMENTATION.pdf"):
+    """Generate API documentation PDF on a worker thread so the event loop stays free"""
+    # Only async callers need asyncio, and they have already imported it
+    import asyncio
+    return await asyncio.to_thread(create_api_pdf, pdf_filename)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[_StatusHandler()])
     create_api_pdf()